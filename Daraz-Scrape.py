@@ -8,10 +8,15 @@
 # - Import all required external libraries and modules.
 # - Each import is explained so you know what it's used for.
 # ---------------------------
-import time  # standard lib for simple delays (used cautiously)
-import requests  # used to fetch product images (HTTP GET)
+import os  # used to build the persistent Chrome profile path
+import queue  # hands scraped pages from the crawl thread to the PDF builder
+import logging  # buffered progress logging (cheaper than print per page)
+import asyncio  # drives the non-blocking image downloads
+import threading  # runs the crawl concurrently with PDF layout
+from functools import lru_cache  # cache the chromedriver path across instantiations
+import httpx  # async HTTP client with HTTP/2 used to fetch product images
 from io import BytesIO  # used to wrap raw image bytes for ReportLab
-from bs4 import BeautifulSoup  # HTML parsing to extract structured data
+from PIL import Image as PILImage  # decode + downscale thumbnails before embedding
 
 # Selenium imports for browser automation:
 from selenium import webdriver  # main Selenium webdriver module
@@ -25,17 +30,49 @@ from selenium.webdriver.support import expected_conditions as EC  # conditions f
 from webdriver_manager.chrome import ChromeDriverManager
 
 # ReportLab imports for PDF generation and layout:
-from reportlab.platypus import (
-    SimpleDocTemplate,  # high-level PDF document builder
-    Paragraph,  # text block element
-    Image,  # image element
-    Spacer,  # vertical spacer
-    Table,  # layout table
-    TableStyle,  # styling for table elements
-)
+from reportlab.pdfgen import canvas  # low-level page-at-a-time PDF writer
 from reportlab.lib.pagesizes import letter  # standard page size
-from reportlab.lib.styles import getSampleStyleSheet  # default paragraph styles
-from reportlab.lib import colors  # color constants for table borders/fills
+from reportlab.lib.utils import ImageReader  # wraps image buffers for drawImage
+from reportlab.lib import colors  # color constants for borders/links
+
+
+# ---------------------------
+# STEP 0.5: Driver-binary and profile caching
+# - ChromeDriverManager().install() checks for driver updates on every call;
+#   caching the resolved path means only the first DarazScraper pays for it.
+# - A persistent user-data-dir keeps cookies/consent state between runs so
+#   repeat crawls skip first-visit dialogs.
+# ---------------------------
+CHROME_PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".daraz-scraper-profile")
+
+# Module logger: progress messages go through logging rather than print, so
+# level/handler configuration controls their cost (a print per page means a
+# pipe syscall per page in headless CI; logging can batch or drop them).
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _chromedriver_path():
+    # Resolve (and if needed download) the chromedriver binary exactly once
+    # per process, no matter how many scraper instances are created.
+    return ChromeDriverManager().install()
+
+
+# ---------------------------
+# STEP 0.6: Product-extraction script
+# - Defined once at import so every parse_products call reuses the same
+#   string (one place to edit selectors, no per-call rebuild).
+# - NOTE: Daraz uses generated class names and these may change.
+# <<< MODIFY HERE IF DARAZ CHANGES PRODUCT CONTAINER CLASS >>>
+# ---------------------------
+EXTRACT_PRODUCTS_JS = """
+return [...document.querySelectorAll('.Bm3ON')].map(p => ({
+    title: p.querySelector('.RfADt')?.innerText?.trim() || 'N/A',
+    price: p.querySelector('.ooOxS')?.innerText?.trim() || 'N/A',
+    link: p.querySelector('a')?.href || null,
+    img: p.querySelector('img')?.src || null,
+}));
+"""
 
 
 # ---------------------------
@@ -44,10 +81,13 @@ from reportlab.lib import colors  # color constants for table borders/fills
 # - Allows instantiation and use in a linear script flow
 # ---------------------------
 class DarazScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, fetch_images=True):
         """
         STEP 1.1 - Initialize WebDriver and options
         - headless: whether to run Chrome without a visible UI
+        - fetch_images: download thumbnail bytes for PDF embedding; pass
+          False (paired with PDFBuilder(embed_images=False)) to skip the
+          image-download phase entirely and keep only img_url
         """
         chrome_options = webdriver.ChromeOptions()  # create Chrome options object
 
@@ -59,61 +99,116 @@ class DarazScraper:
         chrome_options.add_argument("--disable-gpu")  # disable GPU usage (legacy flag, safe)
         chrome_options.add_argument("--start-maximized")  # maximize window to reduce responsive layout surprises
         chrome_options.add_argument("log-level=3")  # reduce chromedriver logs (info/warnings)
+        # Disable Chrome subsystems the scraper never uses; they otherwise
+        # still contend for CPU and memory in the background:
+        chrome_options.add_argument("--no-sandbox")  # required in many container setups
+        chrome_options.add_argument("--disable-dev-shm-usage")  # avoid /dev/shm exhaustion in containers
+        chrome_options.add_argument("--disable-extensions")  # no extensions needed
+        chrome_options.add_argument("--disable-background-networking")  # no update/telemetry traffic
+        chrome_options.add_argument("--disable-background-timer-throttling")  # consistent JS timers
+        chrome_options.add_argument("--disable-renderer-backgrounding")  # keep renderer at full priority
+        chrome_options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
+        chrome_options.add_argument("--no-first-run")  # skip first-run dialogs
+        chrome_options.add_argument("--mute-audio")  # no audio pipeline
+        chrome_options.add_argument("--disable-sync")  # no profile sync
+        # Pairs with the CDP resource blocking below: stop the renderer from
+        # even attempting to decode images
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         # set a realistic user agent to reduce bot detection risk
         chrome_options.add_argument(
             "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
             " AppleWebKit/537.36 (KHTML, like Gecko)"
             " Chrome/131.0.0.0 Safari/537.36"
         )
+        # Reuse a persistent profile so cookies/consent state survive between
+        # runs (skips first-visit dialogs on repeat crawls)
+        chrome_options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIR}")
 
         # STEP 1.2 - Create the webdriver instance using webdriver-manager to auto-install driver.
-        # Service(ChromeDriverManager().install()) ensures the driver binary is available.
+        # _chromedriver_path() resolves the driver binary once per process.
         self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(_chromedriver_path()),
             options=chrome_options,
         )
 
+        # STEP 1.2b - Block heavyweight resources via Chrome DevTools Protocol.
+        # The scraper only reads the HTML (img src attributes included) and
+        # downloads thumbnails itself with httpx, so Chrome never needs to
+        # render images, webfonts, stylesheets or third-party trackers.
+        # Blocking them cuts page weight and speeds up DOM-ready per page.
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs",
+            {
+                "urls": [
+                    "*.png",
+                    "*.jpg",
+                    "*.jpeg",
+                    "*.gif",
+                    "*.webp",
+                    "*.woff*",
+                    "*.css",
+                    "*google-analytics*",
+                    "*facebook*",
+                ]
+            },
+        )
+
         # STEP 1.3 - Create an explicit wait helper
         # WebDriverWait will be used throughout to wait for elements or conditions reliably.
         self.wait = WebDriverWait(self.driver, 15)
 
+        # STEP 1.4 - Cache of downloaded image bytes keyed by URL.
+        # Sponsored products repeat across pages and placeholder thumbnails
+        # are shared; caching skips the repeat HTTP GETs entirely.
+        self._img_cache = {}
+        self.fetch_images = fetch_images
+
     # ---------------------------------------------------------
     # STEP 2: Smooth scrolling
     # - Scroll the page in chunks to trigger lazy-loading and ensure all products are loaded.
     # ---------------------------------------------------------
-    def slow_scroll(self, delay=0.3, chunk=800):
+    def slow_scroll(self, delay=0.15, chunk=800):
         """
-        Scroll down the page in increments.
+        Scroll down the page in increments, entirely inside the browser.
         - delay: pause between scroll increments (seconds)
         - chunk: pixel step size for each scroll
         Logic:
-        1. Query the current full document height.
-        2. Scroll from top to bottom in fixed increments.
-        3. Stop when the incremental position reaches or exceeds the computed document height.
+        1. Hand one async JS snippet to the browser that steps the scroll
+           position on a timer (no WebDriver round trip per step).
+        2. The snippet keeps stepping until scrollHeight stops growing,
+           i.e. lazy-loading has settled, then signals completion.
+        The old Python loop issued two synchronous WebDriver RPCs per
+        chunk plus a fixed sleep; this is a single RPC for the whole page.
         """
-        # STEP 2.1 - Get the current height of the document (total scrollable height)
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        # STEP 2.2 - Start scrolling from position 0
-        current_position = 0
-
-        # STEP 2.3 - Loop until we reach the bottom (or no more growth)
-        while True:
-            # Execute JS to set window scroll to the current position
-            self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-            # Wait briefly to allow lazy-loaded content to appear
-            time.sleep(delay)
-            # Move the current position forward by the defined chunk
-            current_position += chunk
-
-            # Recompute the document height to detect if new content extended the page
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            # If we've reached or exceeded the new height, break the loop (we're at bottom)
-            if current_position >= new_height:
-                break
-
-            # Update last_height for completeness (not strictly necessary here, but keeps logic clear)
-            last_height = new_height
+        # STEP 2.1 - Run the whole scroll loop in the browser; the callback
+        # (last script argument) resolves the execute_async_script call once
+        # the bottom is reached and the document height has stabilised.
+        # chunk and delay are passed once as script arguments, so tuning them
+        # from Python costs no extra WebDriver traffic.
+        self.driver.set_script_timeout(60)
+        self.driver.execute_async_script(
+            """
+            const chunk = arguments[0];
+            const interval = arguments[1];
+            const done = arguments[arguments.length - 1];
+            let y = 0;
+            let last = 0;
+            const timer = setInterval(() => {
+                window.scrollTo(0, y);
+                y += chunk;
+                if (y >= document.body.scrollHeight) {
+                    if (document.body.scrollHeight === last) {
+                        clearInterval(timer);
+                        done(true);
+                    }
+                    last = document.body.scrollHeight;
+                }
+            }, interval);
+            """,
+            chunk,
+            int(delay * 1000),
+        )
 
     # ---------------------------------------------------------
     # STEP 3: Search
@@ -142,78 +237,102 @@ class DarazScraper:
             search_box.send_keys(Keys.ENTER)
         except Exception:
             # If anything fails, print helpful message (do not crash)
-            print("Search bar not found!")
+            logger.warning("Search bar not found!")
 
         # STEP 3.3 - Give the page a bit of time to load results and perform an initial scroll
         self.slow_scroll()
 
     # ---------------------------------------------------------
     # STEP 4: Parse products on current page
-    # - Parse HTML using BeautifulSoup for stable parsing and simpler extraction.
+    # - Extract fields directly in the browser: Chrome already holds a parsed
+    #   DOM, so one querySelectorAll in JS beats serializing the multi-MB
+    #   page_source over the chromedriver pipe and re-parsing it in Python.
     # ---------------------------------------------------------
     def parse_products(self):
         """
         Returns a list of product dicts from the current page.
         Each dict: { title, price, link, img_bytes }
         Logic:
-        1. Parse page_source with BeautifulSoup
-        2. Select product containers by CSS selector (updateable)
-        3. Extract title, price, link, and image bytes (download)
+        1. Run one execute_script that maps every product card to a small
+           {title, price, link, img} object inside the browser
+        2. Only those objects cross the WebDriver pipe (a few KB, not MB)
+        3. Download the referenced images in one concurrent batch
         """
-        # STEP 4.1 - Build BeautifulSoup object from current DOM HTML
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-        # STEP 4.2 - Select product container elements.
-        # NOTE: Daraz uses generated class names and these may change; update this selector if needed.
-        # <<< MODIFY HERE IF DARAZ CHANGES PRODUCT CONTAINER CLASS >>>
-        products = soup.select(".Bm3ON")
-
-        results = []  # STEP 4.3 - Prepare a results list to accumulate product dicts
-
-        # STEP 4.4 - Iterate over each raw product element and extract structured fields
-        for p in products:
-            # Extract title safely - if missing, fallback to "N/A"
-            try:
-                title = p.select_one(".RfADt").text.strip()
-            except:
-                title = "N/A"
-
-            # Extract price safely - if missing, fallback to "N/A"
-            try:
-                price = p.select_one(".ooOxS").text.strip()
-            except:
-                price = "N/A"
-
-            # Extract product link (href). Normalize scheme if necessary.
-            try:
-                link = p.find("a")["href"]
-                # If link is protocol-relative (starts with //), prepend https:
-                if link.startswith("//"):
-                    link = "https:" + link
-            except:
-                link = None
-
-            # Extract image URL and download the bytes for embedding in PDF.
-            try:
-                img_url = p.find("img")["src"]
-                img_bytes = requests.get(img_url).content if img_url else None
-            except:
-                # If download fails, set None. PDFs will use placeholders.
-                img_bytes = None
-
-            # STEP 4.5 - Append the structured product entry to results
+        # STEP 4.1 - Extract all fields in a single in-browser pass using the
+        # module-level EXTRACT_PRODUCTS_JS (selectors live in one place).
+        # The browser resolves a.href/img.src to absolute URLs for us, so no
+        # protocol-relative normalization is needed afterwards.
+        raw = self.driver.execute_script(EXTRACT_PRODUCTS_JS)
+
+        results = []  # STEP 4.2 - Prepare a results list to accumulate product dicts
+        pending_images = []  # (result index, img_url) pairs to download in parallel
+
+        # STEP 4.3 - Reshape the browser objects into the pipeline's dict form.
+        # dict.get with a default keeps this loop exception-free: a missing
+        # key degrades to the placeholder instead of raising per product.
+        for p in raw:
+            # STEP 4.4 - Append the structured product entry to results
             results.append(
                 {
-                    "title": title,
-                    "price": price,
-                    "link": link,
-                    "img_bytes": img_bytes,
+                    "title": p.get("title") or "N/A",
+                    "price": p.get("price") or "N/A",
+                    "link": p.get("link"),
+                    "img_url": p.get("img"),
+                    "img_bytes": None,  # filled in by the parallel download below
                 }
             )
 
-        # STEP 4.6 - Return the list of product dicts for this page
+            # Remember which result index this image URL belongs to
+            img_url = p.get("img")
+            if img_url:
+                pending_images.append((len(results) - 1, img_url))
+
+        # STEP 4.6 - Download all images concurrently with aiohttp.
+        # asyncio.gather fires every request at once over a keep-alive
+        # connection pool, without the per-download thread overhead.
+        # URLs already seen (this page or earlier ones) are served from the
+        # cache, and the fetch list is deduplicated before dispatch.
+        # Skipped entirely in link-only mode (fetch_images=False), which
+        # removes the whole download phase from the critical path.
+        if pending_images and self.fetch_images:
+            to_fetch = []
+            for _, url in pending_images:
+                if url not in self._img_cache and url not in to_fetch:
+                    to_fetch.append(url)
+            if to_fetch:
+                fetched = asyncio.run(self._fetch_all_images(to_fetch))
+                self._img_cache.update(zip(to_fetch, fetched))
+            for idx, url in pending_images:
+                results[idx]["img_bytes"] = self._img_cache.get(url)
+
+        # STEP 4.7 - Return the list of product dicts for this page
         return results
 
+    # ---------------------------------------------------------
+    # STEP 4b: Async image fetcher
+    # - Runs all image downloads for a page concurrently over one
+    #   keep-alive connection pool.
+    # - HTTP/2 lets the CDN multiplex dozens of thumbnail responses over a
+    #   single TCP+TLS connection, so most downloads skip the handshake.
+    # ---------------------------------------------------------
+    async def _fetch_all_images(self, urls):
+        """
+        Fetch every URL concurrently and return the response bodies
+        in the same order as `urls` (None where a download failed).
+        """
+
+        async def fetch(client, url):
+            try:
+                r = await client.get(url, timeout=10)
+                return r.content
+            except Exception:
+                # If download fails, return None. PDFs will use placeholders.
+                return None
+
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        async with httpx.AsyncClient(http2=True, limits=limits) as client:
+            return await asyncio.gather(*[fetch(client, u) for u in urls])
+
     # ---------------------------------------------------------
     # STEP 5: Pagination logic — find and click next page
     # - Locate the <li> that represents the "Next Page" button,
@@ -229,7 +348,8 @@ class DarazScraper:
              - aria-disabled attribute equal to 'false'
         2. Execute a JS click on the li element (which triggers the child button)
            - This avoids reliance on the internal button's class or tag.
-        3. Return True if navigation succeeded, False otherwise.
+        3. Wait until the old product list goes stale and the new one renders.
+        4. Return True if navigation succeeded, False otherwise.
         """
         try:
             # STEP 5.1 - Wait for the next-page <li> that is enabled (aria-disabled='false')
@@ -242,19 +362,30 @@ class DarazScraper:
                 )
             )
 
-            # STEP 5.2 - Click using JavaScript on the found <li> element
+            # STEP 5.2 - Grab a handle on the current product list so we can
+            # detect when the DOM is replaced by the next page's results
+            old_product = self.driver.find_element(By.CSS_SELECTOR, ".Bm3ON")
+
+            # STEP 5.3 - Click using JavaScript on the found <li> element
             # We intentionally click the container instead of a specific inner button
             # because inner tags/classes can be volatile. Clicking the container lets the browser
             # dispatch the event to the actual control inside.
             self.driver.execute_script("arguments[0].click();", next_li)
 
-            # STEP 5.3 - Small delay to allow new page to load and render
-            time.sleep(2)
+            # STEP 5.4 - Wait on real DOM signals instead of a fixed sleep:
+            # the old product element going stale means the list was torn
+            # down, and a fresh .Bm3ON appearing means the new page rendered.
+            # A hard sleep either wastes time on fast connections or parses a
+            # half-rendered page on slow ones.
+            self.wait.until(EC.staleness_of(old_product))
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".Bm3ON"))
+            )
             return True
 
         except Exception:
             # STEP 5.4 - If wait times out or an exception occurs, interpret as no next page
-            print("No Next Page button found or disabled. Reached last page.")
+            logger.info("No Next Page button found or disabled. Reached last page.")
             return False
 
     # ---------------------------------------------------------
@@ -263,37 +394,33 @@ class DarazScraper:
     # ---------------------------------------------------------
     def scrape_all_pages(self):
         """
-        Returns a combined list of product dicts from all pages.
+        Generator yielding one list of product dicts per results page.
+        Yielding page-by-page (instead of returning one giant list) lets
+        the caller consume each page immediately, so at most one page of
+        image bytes is resident at a time.
         Loop structure:
-        1. On each iteration: scroll, parse products, extend master list
+        1. On each iteration: scroll, parse products, yield the page list
         2. Attempt to click 'Next'. If click fails, break the loop (last page).
         """
-        all_results = []  # master accumulator for all pages
-
         while True:
             # STEP 6.1 - Informational log (helps debugging in console)
-            print("Scraping current page...")
+            logger.info("Scraping current page...")
 
             # STEP 6.2 - Make sure page loaded content by scrolling slowly
             self.slow_scroll()
 
-            # STEP 6.3 - Parse the products available on this page
-            page_items = self.parse_products()
+            # STEP 6.3 - Parse the products available on this page and hand
+            # them straight to the caller
+            yield self.parse_products()
 
-            # STEP 6.4 - Extend the global list with this page's items
-            all_results.extend(page_items)
-
-            # STEP 6.5 - Attempt to navigate to the next page
-            print("Trying next page...")
+            # STEP 6.4 - Attempt to navigate to the next page
+            logger.info("Trying next page...")
             has_next = self.click_next_page()
 
-            # STEP 6.6 - If there is no next page, exit the loop
+            # STEP 6.5 - If there is no next page, exit the loop
             if not has_next:
                 break
 
-        # STEP 6.7 - Return the complete aggregated results after finishing pagination
-        return all_results
-
     # ---------------------------------------------------------
     # STEP 7: Clean shutdown
     # - Close the webdriver to free resources.
@@ -308,91 +435,148 @@ class DarazScraper:
 # - Responsible for turning scraped data into a nicely formatted PDF
 # ---------------------------
 class PDFBuilder:
-    def __init__(self, filename="daraz_products.pdf"):
+    # Layout constants for one product row: image box on the left, text on
+    # the right, grey border around the row (mirrors the old table styling)
+    MARGIN = 40  # page margin on all sides
+    ROW_HEIGHT = 132  # 120px image box + padding
+    ROW_GAP = 12  # vertical gap between product rows
+    IMG_BOX = 120  # max thumbnail width/height
+    TEXT_X_OFFSET = 140  # text column starts right of the image box
+
+    def __init__(self, filename="daraz_products.pdf", embed_images=True):
         """
-        STEP 8.1 - Initialize PDF document builder
+        STEP 8.1 - Initialize PDF canvas writer
         - filename: output file path for the generated PDF
+        - embed_images: embed downloaded thumbnails; pass False to emit a
+          clickable [thumbnail] link to the remote image instead, which
+          keeps the PDF tiny and (paired with fetch_images=False on the
+          scraper) skips the download phase altogether
+        Unlike the Platypus SimpleDocTemplate (which keeps every flowable in
+        memory until one final doc.build), the canvas writes each finished
+        page straight to the file, so memory stays flat regardless of how
+        many products are added.
         """
         self.file = filename
-        # Create a SimpleDocTemplate object that manages the PDF build lifecycle
-        self.doc = SimpleDocTemplate(self.file, pagesize=letter)
-        # Grab the sample styles (for Paragraph formatting)
-        self.styles = getSampleStyleSheet()
-        # Elements array will hold flowable elements (Paragraph, Image, Table, etc.)
-        self.elements = []
+        self.embed_images = embed_images
+        # Create the low-level canvas that streams pages to disk
+        self.canvas = canvas.Canvas(self.file, pagesize=letter)
+        self.page_width, self.page_height = letter
+        # Current drawing cursor: top of the first page's content area
+        self.y = self.page_height - self.MARGIN
 
     # ---------------------------------------------------------
     # STEP 9: Add a product entry to the PDF
-    # - Builds a two-column table row: [image | details]
+    # - Draws a bordered row: [image | title / price / link]
     # - Uses fallback placeholders if image or link is missing.
     # ---------------------------------------------------------
     def add_product(self, item):
         """
         Steps to add one product:
-        1. Convert raw image bytes to ReportLab Image if available
-        2. Create Paragraphs for title and price
-        3. Optionally add a clickable link Paragraph
-        4. Compose a Table row [image, [title, price, link]]
-        5. Append to elements list (and spacer)
+        1. Start a new page if the row doesn't fit below the cursor
+        2. Draw the row border, then the thumbnail (or placeholder text)
+        3. Draw title, price and a clickable link annotation
+        4. Advance the cursor past the row
         """
-        # STEP 9.1 - Build left column: image or placeholder text
-        if item["img_bytes"]:
-            try:
-                # Wrap bytes in BytesIO so ReportLab can read it as an image file
-                img = Image(BytesIO(item["img_bytes"]))
-                # Restrict display size to keep table consistent
-                img._restrictSize(120, 120)
-                left_col = img
-            except:
-                # If ReportLab can't process image bytes, use a placeholder Paragraph
-                left_col = Paragraph("Image error", self.styles["Normal"])
-        else:
-            # No image bytes were found, use placeholder text
-            left_col = Paragraph("No Image", self.styles["Normal"])
-
-        # STEP 9.2 - Build right column contents: title and price paragraphs
-        right = [
-            Paragraph(f"<b>{item['title']}</b>", self.styles["Normal"]),  # bold title
-            Paragraph(f"Price: {item['price']}", self.styles["Normal"]),  # price info
-        ]
+        # STEP 9.1 - Page-break check: showPage flushes the finished page's
+        # bytes to the file immediately, freeing its objects
+        if self.y - self.ROW_HEIGHT < self.MARGIN:
+            self.canvas.showPage()
+            self.y = self.page_height - self.MARGIN
+
+        row_top = self.y
+        row_bottom = row_top - self.ROW_HEIGHT
+
+        # STEP 9.2 - Row border (grey box, like the old table style)
+        self.canvas.setStrokeColor(colors.grey)
+        self.canvas.setLineWidth(0.25)
+        self.canvas.rect(
+            self.MARGIN, row_bottom, self.page_width - 2 * self.MARGIN, self.ROW_HEIGHT
+        )
 
-        # STEP 9.3 - Add link paragraph if link exists; else fallback text
-        if item["link"]:
-            right.append(
-                Paragraph(
-                    f"<link href='{item['link']}' color='blue'><u>View Product</u></link>",
-                    self.styles["Normal"],
+        # STEP 9.3 - Left column: thumbnail, remote-image link, or placeholder
+        img_x = self.MARGIN + 6
+        img_y = row_bottom + 6
+        if self.embed_images and item["img_bytes"]:
+            try:
+                # Decode the raw bytes once with Pillow and downscale to the
+                # display size. Embedding the original full-resolution image
+                # (often a large WebP/PNG) would bloat the PDF and slow the
+                # build.
+                im = PILImage.open(BytesIO(item["img_bytes"])).convert("RGB")
+                im.thumbnail((self.IMG_BOX, self.IMG_BOX), PILImage.LANCZOS)
+                buf = BytesIO()
+                im.save(buf, "JPEG", quality=75, optimize=True)
+                buf.seek(0)
+                self.canvas.drawImage(
+                    ImageReader(buf), img_x, img_y, width=im.width, height=im.height
                 )
+            except Exception:
+                # If the image bytes can't be decoded, fall back to text
+                self.canvas.setFont("Helvetica", 9)
+                self.canvas.drawString(img_x, row_top - 16, "Image error")
+        elif item.get("img_url"):
+            # Link-only mode (or download failed but URL known): emit a
+            # clickable reference to the remote image instead of embedding it
+            self.canvas.setFont("Helvetica", 9)
+            self.canvas.setFillColor(colors.blue)
+            self.canvas.drawString(img_x, row_top - 16, "[thumbnail]")
+            thumb_width = self.canvas.stringWidth("[thumbnail]", "Helvetica", 9)
+            self.canvas.linkURL(
+                item["img_url"],
+                (img_x, row_top - 18, img_x + thumb_width, row_top - 7),
+                relative=0,
             )
+            self.canvas.setFillColor(colors.black)
         else:
-            right.append(Paragraph("No product link available", self.styles["Normal"]))
-
-        # STEP 9.4 - Place left_col and right (list of paragraphs) into a single-row Table
-        table = Table([[left_col, right]], colWidths=[130, 400])
-        # STEP 9.5 - Apply simple table styling for border, padding, and alignment
-        table.setStyle(
-            TableStyle(
-                [
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),  # top-align cells
-                    ("BOX", (0, 0), (-1, -1), 0.25, colors.grey),  # outer border
-                    ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.grey),  # inner cell grid
-                    ("PADDING", (0, 0), (-1, -1), 6),  # uniform padding
-                ]
+            # No image bytes or URL were found, use placeholder text
+            self.canvas.setFont("Helvetica", 9)
+            self.canvas.drawString(img_x, row_top - 16, "No Image")
+
+        # STEP 9.4 - Right column: bold title (trimmed to the column width),
+        # price line, and the product link
+        text_x = self.MARGIN + self.TEXT_X_OFFSET
+        max_text_width = self.page_width - self.MARGIN - 6 - text_x
+
+        self.canvas.setFont("Helvetica-Bold", 10)
+        title = item["title"]
+        # Trim the title with an ellipsis rather than overflowing the border
+        while title and self.canvas.stringWidth(title, "Helvetica-Bold", 10) > max_text_width:
+            title = title[:-2] + "…" if title.endswith("…") else title[:-1] + "…"
+        self.canvas.setFillColor(colors.black)
+        self.canvas.drawString(text_x, row_top - 18, title)
+
+        self.canvas.setFont("Helvetica", 10)
+        self.canvas.drawString(text_x, row_top - 34, f"Price: {item['price']}")
+
+        # STEP 9.5 - Clickable link: blue underlined text plus a linkURL
+        # annotation covering its bounding box
+        if item["link"]:
+            link_text = "View Product"
+            link_y = row_top - 50
+            self.canvas.setFillColor(colors.blue)
+            self.canvas.drawString(text_x, link_y, link_text)
+            link_width = self.canvas.stringWidth(link_text, "Helvetica", 10)
+            self.canvas.line(text_x, link_y - 1, text_x + link_width, link_y - 1)
+            self.canvas.linkURL(
+                item["link"],
+                (text_x, link_y - 2, text_x + link_width, link_y + 10),
+                relative=0,
             )
-        )
+            self.canvas.setFillColor(colors.black)
+        else:
+            self.canvas.drawString(text_x, row_top - 50, "No product link available")
 
-        # STEP 9.6 - Append the table row and a spacer to the elements list
-        self.elements.append(table)
-        self.elements.append(Spacer(1, 12))
+        # STEP 9.6 - Advance the cursor past this row plus the gap
+        self.y = row_bottom - self.ROW_GAP
 
     # ---------------------------------------------------------
     # STEP 10: Save PDF file to disk
-    # - Build the document using the accumulated flowables
+    # - Finalize the trailing page and close the file
     # ---------------------------------------------------------
     def save(self):
-        # This triggers ReportLab to compose pages and write the PDF to self.file
-        self.doc.build(self.elements)
-        print(f"PDF saved as {self.file}")
+        # Flush the in-progress page and write the PDF trailer
+        self.canvas.save()
+        logger.info("PDF saved as %s", self.file)
 
 
 # ---------------------------
@@ -400,23 +584,60 @@ class PDFBuilder:
 # - Orchestrates the scraper and PDF generation end-to-end
 # ---------------------------
 if __name__ == "__main__":
-    # STEP 11.1 - Instantiate the scraper (headless=False for visible browser during development)
-    scraper = DarazScraper(headless=False)
-
-    # STEP 11.2 - Perform search on Daraz for your keyword
-    # Replace "Usman" with any keyword you want to crawl
-    scraper.search("Usman")  # change keyword as needed
-
-    # STEP 11.3 - Run the full pagination scrape (scroll → parse → next) across all pages
-    all_data = scraper.scrape_all_pages()
-
-    # STEP 11.4 - Gracefully close the WebDriver (important to free resources)
+    # STEP 11.0 - Configure logging once for script runs. Drop the level to
+    # WARNING to silence per-page progress entirely in batch/CI runs.
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    # STEP 11.1 - Keywords to crawl. One Chrome launch serves all of them;
+    # re-launching the browser per keyword would repay the ~2-4s cold start
+    # every time. Add/remove keywords as needed.
+    queries = ["Usman"]
+
+    # Embed thumbnails in the PDF (True) or emit clickable remote-image
+    # links instead (False). False skips every image download, which is the
+    # fastest option for PDFs meant for online viewing.
+    embed_images = True
+
+    # STEP 11.2 - Instantiate the scraper once (headless=False for visible
+    # browser during development) and reuse it across every keyword
+    scraper = DarazScraper(headless=False, fetch_images=embed_images)
+
+    # STEP 11.3 - Instantiate the PDF builder up front so pages can be
+    # consumed as they are scraped
+    builder = PDFBuilder("daraz_products.pdf", embed_images=embed_images)
+
+    # STEP 11.4 - Pipeline the two phases: the crawl runs on a background
+    # thread pushing per-page lists into a bounded queue, while this thread
+    # lays out PDF rows as pages arrive. While Selenium blocks waiting on
+    # the next page's network, ReportLab is busy with the previous page, so
+    # wall-clock approaches max(scrape_time, pdf_time) instead of their sum.
+    pages = queue.Queue(maxsize=4)
+    END_OF_CRAWL = None  # sentinel pushed once the crawl finishes
+
+    def crawl():
+        try:
+            for query in queries:
+                scraper.search(query)
+                for page_items in scraper.scrape_all_pages():
+                    pages.put(page_items)
+        finally:
+            # Always signal completion, even if the crawl raised
+            pages.put(END_OF_CRAWL)
+
+    crawler = threading.Thread(target=crawl, daemon=True)
+    crawler.start()
+
+    # STEP 11.5 - Consume pages as the crawler produces them
+    while True:
+        page_items = pages.get()
+        if page_items is END_OF_CRAWL:
+            break
+        for item in page_items:
+            builder.add_product(item)
+    crawler.join()
+
+    # STEP 11.6 - Gracefully close the WebDriver (important to free resources)
     scraper.close()
 
-    # STEP 11.5 - Instantiate the PDF builder and populate it with scraped data
-    builder = PDFBuilder("daraz_products.pdf")
-    for item in all_data:
-        builder.add_product(item)
-
-    # STEP 11.6 - Save the final PDF to disk
+    # STEP 11.7 - Save the final PDF to disk
     builder.save()